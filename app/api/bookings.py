@@ -1,21 +1,27 @@
+from functools import lru_cache
 from typing import List, Optional
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, status, Query  # pyright: ignore[reportMissingImports]
-from app.domain.models import Booking, CarStatus
+from app.domain.models import Booking, CarStatus, to_timestamp
 from app.schemas.booking import BookingCreate, BookingResponse
 from app.schemas.car import CarResponse
 from app.repositories.car_repository import CarRepository
 from app.repositories.booking_repository import BookingRepository
+from app.api.cache import ResponseCache
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
+bookings_cache = ResponseCache(List[BookingResponse])
 
+
+@lru_cache(maxsize=1)
 def get_car_repository() -> CarRepository:
     """Get car repository instance."""
     from app.main import car_repo
     return car_repo
 
 
+@lru_cache(maxsize=1)
 def get_booking_repository() -> BookingRepository:
     """Get booking repository instance."""
     from app.main import booking_repo
@@ -23,7 +29,7 @@ def get_booking_repository() -> BookingRepository:
 
 
 @router.post("", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
-def create_booking(booking_data: BookingCreate):
+async def create_booking(booking_data: BookingCreate):
     """Create a new booking."""
     car_repo = get_car_repository()
     booking_repo = get_booking_repository()
@@ -43,7 +49,8 @@ def create_booking(booking_data: BookingCreate):
             detail=f"Car with id {booking_data.car_id} is not available (status: {car.status.value})"
         )
     
-    # Check for conflicting bookings
+    # Check for conflicting bookings. The check and the create below run without
+    # an await in between, so no other request can book the car in the meantime.
     if booking_repo.has_conflicting_booking(
         booking_data.car_id,
         booking_data.start_datetime,
@@ -54,13 +61,19 @@ def create_booking(booking_data: BookingCreate):
             detail=f"Car with id {booking_data.car_id} is already booked for the selected time period"
         )
     
-    booking = Booking(**booking_data.model_dump())
+    booking = Booking(
+        car_id=booking_data.car_id,
+        customer_name=booking_data.customer_name,
+        customer_email=booking_data.customer_email,
+        start_datetime=booking_data.start_datetime,
+        end_datetime=booking_data.end_datetime
+    )
     created_booking = booking_repo.create(booking)
-    return BookingResponse.model_validate(created_booking)
+    return created_booking
 
 
 @router.get("", response_model=List[BookingResponse])
-def get_bookings(
+async def get_bookings(
     car_id: Optional[int] = Query(None, description="Filter bookings by car ID"),
     start_datetime: Optional[datetime] = Query(None, description="Filter bookings that start on or after this datetime"),
     end_datetime: Optional[datetime] = Query(None, description="Filter bookings that end on or before this datetime")
@@ -74,28 +87,15 @@ def get_bookings(
     - start_datetime + end_datetime: Returns bookings that overlap with the datetime range
     """
     booking_repo = get_booking_repository()
-    
-    # Get bookings filtered by car_id if provided
-    if car_id:
-        bookings = booking_repo.get_by_car_id(car_id)
-    else:
-        bookings = booking_repo.get_all()
-    
-    # Apply datetime filters if provided
-    if start_datetime is not None or end_datetime is not None:
-        datetime_filtered = booking_repo.get_by_datetime_range(start_datetime, end_datetime)
-        # Intersect with car_id filtered results if car_id was provided
-        if car_id:
-            datetime_ids = {b.id for b in datetime_filtered}
-            bookings = [b for b in bookings if b.id in datetime_ids]
-        else:
-            bookings = datetime_filtered
-    
-    return [BookingResponse.model_validate(booking) for booking in bookings]
+    return bookings_cache.render(
+        (car_id, start_datetime, end_datetime),
+        booking_repo.version,
+        lambda: booking_repo.filter(car_id, start_datetime, end_datetime)
+    )
 
 
 @router.get("/available-cars", response_model=List[CarResponse])
-def get_available_cars(
+async def get_available_cars(
     start_datetime: datetime = Query(..., description="Filter cars available from this datetime"),
     end_datetime: datetime = Query(..., description="Filter cars available until this datetime")
 ):
@@ -108,34 +108,25 @@ def get_available_cars(
     car_repo = get_car_repository()
     booking_repo = get_booking_repository()
     
-    # Validate that end_datetime is after start_datetime
-    if end_datetime <= start_datetime:
+    # Validate that end_datetime is after start_datetime, comparing naive and
+    # aware datetimes the same way the bookings are indexed
+    if to_timestamp(end_datetime) <= to_timestamp(start_datetime):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="end_datetime must be after start_datetime"
         )
     
-    cars = car_repo.get_all()
-    available_cars = []
-    
-    for car in cars:
-        # Check if car is available (not in maintenance)
-        if car.status != CarStatus.AVAILABLE:
-            continue
-        
-        # Check if car has conflicting bookings for the requested date range
-        if not booking_repo.has_conflicting_booking(
-            car.id,
-            start_datetime,
-            end_datetime
-        ):
-            available_cars.append(car)
+    busy_car_ids = booking_repo.busy_cars_in_range(start_datetime, end_datetime)
+    available_cars = [
+        car for car in car_repo.get_available()
+        if car.id not in busy_car_ids
+    ]
     
-    return [CarResponse.model_validate(car) for car in available_cars]
+    return available_cars
 
 
 @router.get("/{booking_id}", response_model=BookingResponse)
-def get_booking(booking_id: int):
+async def get_booking(booking_id: int):
     """Get a specific booking by ID."""
     booking_repo = get_booking_repository()
     booking = booking_repo.get_by_id(booking_id)
@@ -144,11 +135,11 @@ def get_booking(booking_id: int):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Booking with id {booking_id} not found"
         )
-    return BookingResponse.model_validate(booking)
+    return booking
 
 
 @router.delete("/{booking_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_booking(booking_id: int):
+async def delete_booking(booking_id: int):
     """Cancel a booking."""
     booking_repo = get_booking_repository()
     
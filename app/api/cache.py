@@ -0,0 +1,41 @@
+"""
+Cache for serialized GET responses.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+class ResponseCache:
+    """Cache of serialized JSON bodies for a read endpoint.
+    
+    Entries are tagged with the version of the data they were rendered from and
+    are all dropped as soon as a different version is requested, so the cache
+    never needs explicit invalidation and only holds entries for the current data.
+    Keys come from client-supplied query parameters, so at most maxsize entries
+    are kept and the least recently used one is evicted first.
+    """
+    
+    def __init__(self, response_type: Any, maxsize: int = 128):
+        self._adapter = TypeAdapter(response_type)
+        self._maxsize = maxsize
+        self._version: Optional[int] = None
+        self._bodies: OrderedDict[Hashable, bytes] = OrderedDict()
+    
+    def render(self, key: Hashable, version: int, load: Callable[[], Any]) -> Response:
+        """Get the JSON response for a key, loading and serializing it on a miss."""
+        if version != self._version:
+            self._bodies.clear()
+            self._version = version
+        
+        body = self._bodies.get(key)
+        if body is None:
+            content = self._adapter.validate_python(load(), from_attributes=True)
+            body = self._adapter.dump_json(content)
+            self._bodies[key] = body
+            if len(self._bodies) > self._maxsize:
+                self._bodies.popitem(last=False)
+        else:
+            self._bodies.move_to_end(key)
+        return Response(content=body, media_type="application/json")
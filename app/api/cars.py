@@ -1,3 +1,5 @@
+import dataclasses
+from functools import lru_cache
 from typing import List
 from fastapi import APIRouter, HTTPException, status
 from app.domain.models import Car
@@ -5,22 +7,28 @@ from app.schemas.car import CarCreate, CarUpdate, CarResponse
 from app.repositories.car_repository import CarRepository
 from app.repositories.booking_repository import BookingRepository
 from app.repositories.dealer_repository import DealerRepository
+from app.api.cache import ResponseCache
 
 router = APIRouter(prefix="/cars", tags=["cars"])
 
+cars_cache = ResponseCache(List[CarResponse])
 
+
+@lru_cache(maxsize=1)
 def get_car_repository() -> CarRepository:
     """Get car repository instance."""
     from app.main import car_repo
     return car_repo
 
 
+@lru_cache(maxsize=1)
 def get_booking_repository() -> BookingRepository:
     """Get booking repository instance."""
     from app.main import booking_repo
     return booking_repo
 
 
+@lru_cache(maxsize=1)
 def get_dealer_repository() -> DealerRepository:
     """Get dealer repository instance."""
     from app.main import dealer_repo
@@ -28,7 +36,7 @@ def get_dealer_repository() -> DealerRepository:
 
 
 @router.post("", response_model=CarResponse, status_code=status.HTTP_201_CREATED)
-def create_car(car_data: CarCreate):
+async def create_car(car_data: CarCreate):
     """Create a new car in the inventory."""
     car_repo = get_car_repository()
     dealer_repo = get_dealer_repository()
@@ -51,19 +59,18 @@ def create_car(car_data: CarCreate):
     
     car = Car(**car_data.model_dump())
     created_car = car_repo.create(car)
-    return CarResponse.model_validate(created_car)
+    return created_car
 
 
 @router.get("", response_model=List[CarResponse])
-def get_cars():
+async def get_cars():
     """Get all cars."""
     car_repo = get_car_repository()
-    cars = car_repo.get_all()
-    return [CarResponse.model_validate(car) for car in cars]
+    return cars_cache.render((), car_repo.version, car_repo.get_all)
 
 
 @router.get("/{car_id}", response_model=CarResponse)
-def get_car(car_id: int):
+async def get_car(car_id: int):
     """Get a specific car by ID."""
     car_repo = get_car_repository()
     car = car_repo.get_by_id(car_id)
@@ -72,11 +79,11 @@ def get_car(car_id: int):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Car with id {car_id} not found"
         )
-    return CarResponse.model_validate(car)
+    return car
 
 
 @router.put("/{car_id}", response_model=CarResponse)
-def update_car(car_id: int, car_data: CarUpdate):
+async def update_car(car_id: int, car_data: CarUpdate):
     """Update a car."""
     car_repo = get_car_repository()
     
@@ -108,14 +115,14 @@ def update_car(car_id: int, car_data: CarUpdate):
     
     # Update only provided fields
     update_data = car_data.model_dump(exclude_unset=True)
-    updated_car = existing_car.model_copy(update=update_data)
+    updated_car = dataclasses.replace(existing_car, **update_data)
     updated_car = car_repo.update(car_id, updated_car)
     
-    return CarResponse.model_validate(updated_car)
+    return updated_car
 
 
 @router.delete("/{car_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_car(car_id: int):
+async def delete_car(car_id: int):
     """Delete a car."""
     car_repo = get_car_repository()
     booking_repo = get_booking_repository()
@@ -0,0 +1,18 @@
+"""
+Application configuration.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AppConfig:
+    """Settings for building the FastAPI application.
+    
+    Frozen and hashable, so a config can key the create_app() cache.
+    """
+    title: str = "Oscar Mobility Dealership API"
+    description: str = "API for managing car inventory and date-based bookings"
+    version: str = "1.0.0"
+    docs_url: Optional[str] = "/docs"
+    api_prefix: str = "/api/v1"
@@ -1,7 +1,7 @@
-from datetime import date, datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field, model_validator, ConfigDict
 
 
 class CarStatus(str, Enum):
@@ -10,74 +10,59 @@ class CarStatus(str, Enum):
     MAINTENANCE = "maintenance"
 
 
-class Dealer(BaseModel):
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_timestamp(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch.
+    
+    Naive datetimes are treated as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+# Domain models are plain slotted dataclasses: input is validated once by the
+# request schemas in app.schemas, so entities are stored without re-validation.
+
+
+@dataclass(slots=True, kw_only=True)
+class Dealer:
     """Domain model for a dealer."""
     id: Optional[int] = None
-    name: str = Field(..., min_length=1)
+    name: str
     location: Optional[str] = None
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "name": "Oscar Mobility Downtown",
-                "location": "New York, NY"
-            }
-        }
-    )
-
 
-class Car(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Car:
     """Domain model for a car in the dealership inventory."""
     id: Optional[int] = None
     brand: str
     model: str
-    year: int = Field(..., gt=1900, le=date.today().year + 1)
+    year: int
     color: str
-    daily_price: float = Field(..., gt=0)
-    vin: str = Field(..., min_length=17, max_length=17)
+    daily_price: float
+    vin: str
     status: CarStatus = CarStatus.AVAILABLE
-    dealer_id: int = Field(..., gt=0)
+    dealer_id: int
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "brand": "Toyota",
-                "model": "Camry",
-                "year": 2023,
-                "color": "Blue",
-                "daily_price": 35000.0,
-                "vin": "1HGBH41JXMN109186",
-                "status": "available",
-                "dealer_id": 1
-            }
-        }
-    )
 
-
-class Booking(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Booking:
     """Domain model for a car booking."""
     id: Optional[int] = None
     car_id: int
-    customer_name: str = Field(..., min_length=1)
-    customer_email: str = Field(..., pattern=r'^[^@]+@[^@]+\.[^@]+$')
+    customer_name: str
+    customer_email: str
     start_datetime: datetime
     end_datetime: datetime
+    # Epoch microseconds cached for cheap integer comparisons in overlap checks
+    start_ts: int = field(init=False, repr=False, compare=False)
+    end_ts: int = field(init=False, repr=False, compare=False)
 
-    @model_validator(mode='after')
-    def validate_datetimes(self):
-        """Validate that end_datetime is after start_datetime."""
-        if self.end_datetime <= self.start_datetime:
-            raise ValueError("end_datetime must be after start_datetime")
-        return self
-
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "car_id": 1,
-                "customer_name": "John Doe",
-                "customer_email": "john.doe@example.com",
-                "start_datetime": "2024-01-15T10:00:00",
-                "end_datetime": "2024-01-20T14:00:00"
-            }
-        }
-    )
+    def __post_init__(self):
+        self.start_ts = to_timestamp(self.start_datetime)
+        self.end_ts = to_timestamp(self.end_datetime)
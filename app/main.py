@@ -1,5 +1,8 @@
+from functools import lru_cache
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.api.router import api_router
+from app.config import AppConfig
 from app.domain.models import Car, Booking, Dealer
 from app.repositories.database import InMemoryDatabase
 from app.repositories.car_repository import CarRepository
@@ -24,21 +27,34 @@ if not dealer_repo.get_all():
     )
     dealer_repo.create(initial_dealer)
 
-# Create FastAPI application
-app = FastAPI(
-    title="Oscar Mobility Dealership API",
-    description="API for managing car inventory and date-based bookings",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url=None
-)
 
-# Include API routes
-app.include_router(api_router, prefix="/api/v1")
-
-
-@app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+
+def create_app(config: AppConfig = AppConfig()) -> FastAPI:
+    """Create the FastAPI application, reusing the one already built for an equal config."""
+    # Pass the config positionally so every call style shares one cache key
+    return _build_app(config)
+
+
+@lru_cache(maxsize=8)
+def _build_app(config: AppConfig) -> FastAPI:
+    """Build a FastAPI application for a config."""
+    application = FastAPI(
+        title=config.title,
+        description=config.description,
+        version=config.version,
+        docs_url=config.docs_url,
+        redoc_url=None,
+        default_response_class=ORJSONResponse
+    )
+    
+    # Include API routes
+    application.include_router(api_router, prefix=config.api_prefix)
+    application.get("/health")(health_check)
+    return application
+
+
+app = create_app()
@@ -1,7 +1,58 @@
+import bisect
+import itertools
 from datetime import datetime
-from typing import List, Optional
-from app.domain.models import Booking
-from app.repositories.database import InMemoryDatabase
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from app.domain.models import Booking, to_timestamp
+from app.repositories.database import InMemoryDatabase, Snapshot
+
+# A booking's (start_ts, end_ts, booking ID), ordered by start then end
+TimelineEntry = Tuple[int, int, int]
+
+
+def _timeline_entry(booking: Booking) -> TimelineEntry:
+    """Get the timeline entry of a booking."""
+    return booking.start_ts, booking.end_ts, booking.id
+
+
+def _timeline_overlaps(
+    timeline: List[TimelineEntry],
+    start_ts: int,
+    end_ts: int,
+    exclude_booking_id: Optional[int] = None
+) -> bool:
+    """Check if any entry in a sorted timeline overlaps with the timestamps."""
+    # Only entries starting before end_ts can overlap; (end_ts,) sorts before
+    # every entry starting at end_ts
+    candidates = bisect.bisect_left(timeline, (end_ts,))
+    # Every candidate starts before end_ts, so it only has to end after start_ts.
+    # Walk candidates latest-first: they are the most likely to reach start_ts.
+    latest_first = itertools.islice(reversed(timeline), len(timeline) - candidates, None)
+    return any(
+        entry_end > start_ts
+        for _, entry_end, booking_id in latest_first
+        if booking_id != exclude_booking_id
+    )
+
+
+def _overlaps(booking: Booking, start_ts: int, end_ts: int) -> bool:
+    """Check if a booking overlaps with a timestamp range."""
+    # Overlap occurs if: booking.start < range_end AND booking.end > range_start
+    return booking.start_ts < end_ts and booking.end_ts > start_ts
+
+
+def _matches_datetime_range(
+    booking: Booking,
+    start_ts: Optional[int],
+    end_ts: Optional[int]
+) -> bool:
+    """Check if a booking matches an optionally open-ended timestamp range filter."""
+    if start_ts is not None and end_ts is not None:
+        return _overlaps(booking, start_ts, end_ts)
+    if start_ts is not None:
+        # Bookings that start on or after start_ts
+        return booking.start_ts >= start_ts
+    # Bookings that end on or before end_ts
+    return booking.end_ts <= end_ts
 
 
 class BookingRepository:
@@ -9,10 +60,30 @@ class BookingRepository:
     
     def __init__(self, db: InMemoryDatabase[Booking]):
         self.db = db
+        # Secondary index: car ID -> {booking ID -> booking}
+        self._by_car: Dict[int, Dict[int, Booking]] = {}
+        # Car ID -> sorted timeline entries of the car's bookings
+        self._timeline: Dict[int, List[TimelineEntry]] = {}
+    
+    @property
+    def version(self) -> int:
+        """Get the version of the bookings storage, bumped on every change."""
+        return self.db.version
     
     def create(self, booking: Booking) -> Booking:
         """Create a new booking."""
-        return self.db.create(booking)
+        with self.db.lock:
+            created_booking = self.db.create(booking)
+            self._index(created_booking)
+            return created_booking
+    
+    def create_many(self, bookings: Iterable[Booking]) -> List[Booking]:
+        """Create several bookings at once."""
+        with self.db.lock:
+            created_bookings = self.db.create_many(bookings)
+            for booking in created_bookings:
+                self._index(booking)
+            return created_bookings
     
     def get_by_id(self, booking_id: int) -> Optional[Booking]:
         """Get a booking by ID."""
@@ -24,8 +95,7 @@ class BookingRepository:
     
     def get_by_car_id(self, car_id: int) -> List[Booking]:
         """Get all bookings for a specific car."""
-        bookings = self.db.get_all()
-        return [booking for booking in bookings if booking.car_id == car_id]
+        return list(self._by_car.get(car_id, {}).values())
 
     def get_by_datetime_range(
         self,
@@ -39,28 +109,38 @@ class BookingRepository:
         If only end_datetime is provided, returns bookings that end on or before it.
         If both are provided, returns bookings that overlap with the range.
         """
-        bookings = self.db.get_all()
+        return self.filter(start_datetime=start_datetime, end_datetime=end_datetime)
+
+    def filter(
+        self,
+        car_id: Optional[int] = None,
+        start_datetime: Optional[datetime] = None,
+        end_datetime: Optional[datetime] = None
+    ) -> List[Booking]:
+        """Get bookings filtered by car ID and/or datetime range.
+        
+        The car ID filter is applied first through the per-car index, so the
+        datetime predicate only runs over that car's bookings. Datetime filters
+        follow the semantics of get_by_datetime_range.
+        """
+        if car_id:
+            car_bookings = self._by_car.get(car_id)
+            if not car_bookings:
+                # Nothing left for the datetime predicate to narrow down
+                return []
+            bookings = car_bookings.values()
+        else:
+            bookings = self.db.iter_all()
         
         if start_datetime is None and end_datetime is None:
-            return bookings
-        
-        filtered = []
-        for booking in bookings:
-            if start_datetime is not None and end_datetime is not None:
-                # Check if booking overlaps with the specified range
-                # Overlap occurs if: booking.start < filter_end AND booking.end > filter_start
-                if booking.start_datetime < end_datetime and booking.end_datetime > start_datetime:
-                    filtered.append(booking)
-            elif start_datetime is not None:
-                # Filter: bookings that start on or after start_datetime
-                if booking.start_datetime >= start_datetime:
-                    filtered.append(booking)
-            elif end_datetime is not None:
-                # Filter: bookings that end on or before end_datetime
-                if booking.end_datetime <= end_datetime:
-                    filtered.append(booking)
+            return list(bookings)
         
-        return filtered
+        start_ts = to_timestamp(start_datetime) if start_datetime is not None else None
+        end_ts = to_timestamp(end_datetime) if end_datetime is not None else None
+        return [
+            booking for booking in bookings
+            if _matches_datetime_range(booking, start_ts, end_ts)
+        ]
 
     def has_conflicting_booking(
         self, 
@@ -69,20 +149,72 @@ class BookingRepository:
         end_datetime: datetime,
         exclude_booking_id: Optional[int] = None
     ) -> bool:
-        """Check if there's a conflicting booking for the given car and datetimes."""
-        car_bookings = self.get_by_car_id(car_id)
+        """Check if there's a conflicting booking for the given car and datetimes.
         
-        for booking in car_bookings:
-            if exclude_booking_id and booking.id == exclude_booking_id:
-                continue
-            
-            # Check for overlap: booking conflicts if datetimes overlap
-            if not (end_datetime <= booking.start_datetime or start_datetime >= booking.end_datetime):
-                return True
+        The car's timeline is sorted by start_datetime, so only bookings starting
+        before end_datetime are examined.
+        """
+        timeline = self._timeline.get(car_id)
+        if not timeline:
+            return False
+        return _timeline_overlaps(
+            timeline,
+            to_timestamp(start_datetime),
+            to_timestamp(end_datetime),
+            exclude_booking_id
+        )
+    
+    def busy_cars_in_range(self, start_datetime: datetime, end_datetime: datetime) -> Set[int]:
+        """Get the IDs of cars with at least one booking overlapping the datetimes.
         
-        return False
+        Only cars that have bookings are visited, in a single pass over the timelines.
+        """
+        start_ts = to_timestamp(start_datetime)
+        end_ts = to_timestamp(end_datetime)
+        return {
+            car_id
+            for car_id, timeline in self._timeline.items()
+            if _timeline_overlaps(timeline, start_ts, end_ts)
+        }
     
     def delete(self, booking_id: int) -> bool:
         """Delete a booking."""
-        return self.db.delete(booking_id)
+        with self.db.lock:
+            booking = self.db.get_by_id(booking_id)
+            deleted = self.db.delete(booking_id)
+            if deleted:
+                car_bookings = self._by_car[booking.car_id]
+                del car_bookings[booking_id]
+                if not car_bookings:
+                    del self._by_car[booking.car_id]
+                timeline = self._timeline[booking.car_id]
+                del timeline[bisect.bisect_left(timeline, _timeline_entry(booking))]
+                if not timeline:
+                    del self._timeline[booking.car_id]
+            return deleted
+    
+    def clear(self):
+        """Clear all bookings and their indexes."""
+        with self.db.lock:
+            self.db.clear()
+            self._by_car.clear()
+            self._timeline.clear()
+    
+    def snapshot(self) -> Snapshot:
+        """Capture the current bookings, to be rolled back to with restore()."""
+        return self.db.snapshot()
+    
+    def restore(self, snapshot: Snapshot):
+        """Restore bookings captured by snapshot() and rebuild the indexes."""
+        with self.db.lock:
+            self.db.restore(snapshot)
+            self._by_car.clear()
+            self._timeline.clear()
+            for booking in self.db.iter_all():
+                self._index(booking)
+    
+    def _index(self, booking: Booking):
+        """Add a stored booking to the indexes. The caller holds the lock."""
+        self._by_car.setdefault(booking.car_id, {})[booking.id] = booking
+        bisect.insort(self._timeline.setdefault(booking.car_id, []), _timeline_entry(booking))
 
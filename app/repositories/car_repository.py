@@ -1,6 +1,6 @@
-from typing import List, Optional
-from app.domain.models import Car
-from app.repositories.database import InMemoryDatabase
+from typing import Dict, List, Optional, Set
+from app.domain.models import Car, CarStatus
+from app.repositories.database import InMemoryDatabase, Snapshot
 
 
 class CarRepository:
@@ -8,10 +8,22 @@ class CarRepository:
     
     def __init__(self, db: InMemoryDatabase[Car]):
         self.db = db
+        # Secondary index: VIN -> car ID
+        self._vin_index: Dict[str, int] = {}
+        # IDs of cars with status 'available'
+        self._available_ids: Set[int] = set()
+    
+    @property
+    def version(self) -> int:
+        """Get the version of the cars storage, bumped on every change."""
+        return self.db.version
     
     def create(self, car: Car) -> Car:
         """Create a new car."""
-        return self.db.create(car)
+        with self.db.lock:
+            created_car = self.db.create(car)
+            self._index(created_car)
+            return created_car
     
     def get_by_id(self, car_id: int) -> Optional[Car]:
         """Get a car by ID."""
@@ -23,17 +35,75 @@ class CarRepository:
     
     def update(self, car_id: int, car: Car) -> Optional[Car]:
         """Update a car."""
-        return self.db.update(car_id, car)
+        with self.db.lock:
+            existing_car = self.db.get_by_id(car_id)
+            previous_vin = existing_car.vin if existing_car else None
+            updated_car = self.db.update(car_id, car)
+            if updated_car is not None:
+                if previous_vin != updated_car.vin:
+                    self._discard_vin(previous_vin, car_id)
+                self._vin_index[updated_car.vin] = car_id
+                self._index_status(updated_car)
+            return updated_car
     
     def delete(self, car_id: int) -> bool:
         """Delete a car."""
-        return self.db.delete(car_id)
+        with self.db.lock:
+            car = self.db.get_by_id(car_id)
+            deleted = self.db.delete(car_id)
+            if deleted:
+                self._discard_vin(car.vin, car_id)
+                self._available_ids.discard(car_id)
+            return deleted
     
     def get_by_vin(self, vin: str) -> Optional[Car]:
         """Get a car by VIN."""
-        cars = self.db.get_all()
-        for car in cars:
-            if car.vin == vin:
-                return car
+        car_id = self._vin_index.get(vin)
+        if car_id is None:
+            return None
+        car = self.db.get_by_id(car_id)
+        # Cars mutated in place can leave a stale entry behind, so double-check
+        if car is not None and car.vin == vin:
+            return car
         return None
-
+    
+    def get_available(self) -> List[Car]:
+        """Get all cars with status 'available', in ID order."""
+        return [self.db.get_by_id(car_id) for car_id in sorted(self._available_ids)]
+    
+    def clear(self):
+        """Clear all cars and their indexes."""
+        with self.db.lock:
+            self.db.clear()
+            self._vin_index.clear()
+            self._available_ids.clear()
+    
+    def snapshot(self) -> Snapshot:
+        """Capture the current cars, to be rolled back to with restore()."""
+        return self.db.snapshot()
+    
+    def restore(self, snapshot: Snapshot):
+        """Restore cars captured by snapshot() and rebuild the indexes."""
+        with self.db.lock:
+            self.db.restore(snapshot)
+            self._vin_index.clear()
+            self._available_ids.clear()
+            for car in self.db.iter_all():
+                self._index(car)
+    
+    def _index(self, car: Car):
+        """Add a stored car to the indexes. The caller holds the lock."""
+        self._vin_index[car.vin] = car.id
+        self._index_status(car)
+    
+    def _discard_vin(self, vin: Optional[str], car_id: int):
+        """Remove a VIN from the index if it still points to the given car."""
+        if self._vin_index.get(vin) == car_id:
+            del self._vin_index[vin]
+    
+    def _index_status(self, car: Car):
+        """Add or remove a car from the available index based on its status."""
+        if car.status == CarStatus.AVAILABLE:
+            self._available_ids.add(car.id)
+        else:
+            self._available_ids.discard(car.id)
@@ -1,35 +1,67 @@
 """
-In-memory database using Pydantic models.
+In-memory database for domain models.
 """
-from typing import Dict, TypeVar, Generic, Optional
+import itertools
+import threading
+from typing import Dict, Iterable, Tuple, TypeVar, Generic, Optional
 
 T = TypeVar('T')
 
+# Stored items by ID, plus the next ID to assign
+Snapshot = Tuple[Dict[int, T], int]
+
+# Sentinel for items without an id attribute
+_MISSING = object()
+
 
 class InMemoryDatabase(Generic[T]):
-    """Generic in-memory database storage."""
+    """Generic in-memory database storage.
+    
+    Every mutation holds the lock, so concurrent writers from the event loop and
+    other threads (e.g. tests) never interleave ID assignment or storage updates.
+    The lock is reentrant: repositories hold it across a write and their own
+    index upkeep. Reads are not locked.
+    """
     
     def __init__(self):
         self._storage: Dict[int, T] = {}
-        self._next_id = 1
+        self._id_gen = itertools.count(1)
+        self._version = 0
+        self._lock = threading.RLock()
+    
+    @property
+    def lock(self) -> threading.RLock:
+        """Get the lock guarding mutations, for writes that span several steps."""
+        return self._lock
+    
+    @property
+    def version(self) -> int:
+        """Get the storage version, bumped on every change."""
+        return self._version
     
     def create(self, item: T) -> T:
         """Create a new item and assign it an ID."""
-        if hasattr(item, 'id') and item.id is None:
-            item.id = self._next_id
-            self._next_id += 1
-        elif hasattr(item, 'id') and item.id in self._storage:
-            raise ValueError(f"Item with id {item.id} already exists")
-        elif not hasattr(item, 'id'):
-            # For items without id attribute, use next_id as key
-            item_id = self._next_id
-            self._next_id += 1
-            self._storage[item_id] = item
+        with self._lock:
+            self._insert(item)
+            self._version += 1
             return item
+    
+    def create_many(self, items: Iterable[T]) -> list[T]:
+        """Create several items at once, bumping the version a single time.
         
-        item_id = item.id
-        self._storage[item_id] = item
-        return item
+        Either all items are created or, if one of them fails, none are.
+        """
+        with self._lock:
+            created = {}
+            try:
+                for item in items:
+                    created[self._insert(item)] = item
+            except Exception:
+                for item_id in created:
+                    del self._storage[item_id]
+                raise
+            self._version += 1
+            return list(created.values())
     
     def get_by_id(self, item_id: int) -> Optional[T]:
         """Get an item by its ID."""
@@ -39,21 +71,32 @@ class InMemoryDatabase(Generic[T]):
         """Get all items."""
         return list(self._storage.values())
     
+    def iter_all(self) -> Iterable[T]:
+        """Get a read-only view over all items, without copying them into a list.
+        
+        The view reflects later changes, so use get_all() when a snapshot is needed.
+        """
+        return self._storage.values()
+    
     def update(self, item_id: int, item: T) -> Optional[T]:
         """Update an item by its ID."""
-        if item_id not in self._storage:
-            return None
-        if hasattr(item, 'id'):
-            item.id = item_id
-        self._storage[item_id] = item
-        return item
+        with self._lock:
+            if item_id not in self._storage:
+                return None
+            if hasattr(item, 'id'):
+                item.id = item_id
+            self._storage[item_id] = item
+            self._version += 1
+            return item
     
     def delete(self, item_id: int) -> bool:
         """Delete an item by its ID."""
-        if item_id in self._storage:
-            del self._storage[item_id]
-            return True
-        return False
+        with self._lock:
+            if item_id in self._storage:
+                del self._storage[item_id]
+                self._version += 1
+                return True
+            return False
     
     def exists(self, item_id: int) -> bool:
         """Check if an item exists."""
@@ -61,5 +104,39 @@ class InMemoryDatabase(Generic[T]):
     
     def clear(self):
         """Clear all items from the database."""
-        self._storage.clear()
-        self._next_id = 1
+        with self._lock:
+            self._storage.clear()
+            self._id_gen = itertools.count(1)
+            # Keep counting up so versions observed before the clear are never reused
+            self._version += 1
+    
+    def _insert(self, item: T) -> int:
+        """Store an item and return its ID. The caller holds the lock."""
+        item_id = getattr(item, 'id', _MISSING)
+        if item_id is None:
+            item_id = item.id = next(self._id_gen)
+        elif item_id is _MISSING:
+            # For items without id attribute, use the next ID as key
+            item_id = next(self._id_gen)
+        elif item_id in self._storage:
+            raise ValueError(f"Item with id {item_id} already exists")
+        self._storage[item_id] = item
+        return item_id
+    
+    def snapshot(self) -> Snapshot:
+        """Capture the stored items and ID assignment state.
+        
+        The snapshot is shallow: items mutated in place are not rolled back.
+        """
+        with self._lock:
+            next_id = next(self._id_gen)
+            self._id_gen = itertools.count(next_id)
+            return dict(self._storage), next_id
+    
+    def restore(self, snapshot: Snapshot):
+        """Restore the state captured by snapshot()."""
+        items, next_id = snapshot
+        with self._lock:
+            self._storage = dict(items)
+            self._id_gen = itertools.count(next_id)
+            self._version += 1
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from app.domain.models import Dealer
-from app.repositories.database import InMemoryDatabase
+from app.repositories.database import InMemoryDatabase, Snapshot
 
 
 class DealerRepository:
@@ -28,4 +28,11 @@ class DealerRepository:
     def delete(self, dealer_id: int) -> bool:
         """Delete a dealer."""
         return self.db.delete(dealer_id)
-
+    
+    def snapshot(self) -> Snapshot:
+        """Capture the current dealers, to be rolled back to with restore()."""
+        return self.db.snapshot()
+    
+    def restore(self, snapshot: Snapshot):
+        """Restore dealers captured by snapshot()."""
+        self.db.restore(snapshot)
@@ -1,19 +1,23 @@
 from datetime import datetime
 from pydantic import BaseModel, Field, model_validator, ConfigDict
+from app.domain.models import to_timestamp
+
+# Compiled once by pydantic-core when the schema is built, not per validation
+EMAIL_PATTERN = r'^[^@]+@[^@]+\.[^@]+$'
 
 
 class BookingCreate(BaseModel):
     """Schema for creating a new booking."""
     car_id: int = Field(..., gt=0)
     customer_name: str = Field(..., min_length=1)
-    customer_email: str = Field(..., pattern=r'^[^@]+@[^@]+\.[^@]+$')
+    customer_email: str = Field(..., pattern=EMAIL_PATTERN)
     start_datetime: datetime
     end_datetime: datetime
 
     @model_validator(mode='after')
     def validate_datetimes(self):
-        """Validate that end_datetime is after start_datetime."""
-        if self.end_datetime <= self.start_datetime:
+        """Validate that end_datetime is after start_datetime, treating naive datetimes as UTC."""
+        if to_timestamp(self.end_datetime) <= to_timestamp(self.start_datetime):
             raise ValueError("end_datetime must be after start_datetime")
         return self
 
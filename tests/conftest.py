@@ -0,0 +1,131 @@
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from app.domain.models import Car, CarStatus
+
+
+# app.main builds the application and its repositories on import, so it is
+# imported by the fixtures below rather than at collection time.
+@pytest.fixture(scope="session")
+def app():
+    """Get the FastAPI application."""
+    from app.main import create_app
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def car_repo():
+    """Get the application's car repository."""
+    from app.main import car_repo
+    return car_repo
+
+
+@pytest.fixture(scope="session")
+def booking_repo():
+    """Get the application's booking repository."""
+    from app.main import booking_repo
+    return booking_repo
+
+
+@pytest.fixture(scope="session")
+def dealer_repo():
+    """Get the application's dealer repository."""
+    from app.main import dealer_repo
+    return dealer_repo
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a test client shared by the whole session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(app):
+    """Create an async client that calls the app in-process on the test's event loop."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session", autouse=True)
+def initial_dealer(dealer_repo):
+    """Get the dealer seeded by app.main, shared by the whole session.
+    
+    The repositories start out holding only this dealer, and the per-test
+    rollback keeps it in place, so nothing has to be cleared or re-inserted.
+    """
+    (dealer,) = dealer_repo.get_all()
+    return dealer
+
+
+@pytest.fixture(autouse=True)
+def clear_database(car_repo, booking_repo, dealer_repo):
+    """Roll the databases back to their seeded state after each test."""
+    repos = (car_repo, booking_repo, dealer_repo)
+    snapshots = [repo.snapshot() for repo in repos]
+    yield
+    for repo, snapshot in zip(repos, snapshots):
+        repo.restore(snapshot)
+
+
+@pytest.fixture
+def make_car(car_repo, initial_dealer):
+    """Get a factory that creates cars, overriding the sample car's fields."""
+    def _make(**overrides):
+        fields = {
+            "brand": "Toyota",
+            "model": "Camry",
+            "year": 2023,
+            "color": "Blue",
+            "daily_price": 35000.0,
+            "vin": "1HGBH41JXMN109186",
+            "status": CarStatus.AVAILABLE,
+            "dealer_id": initial_dealer.id,
+            **overrides
+        }
+        return car_repo.create(Car(**fields))
+    return _make
+
+
+@pytest.fixture
+def sample_car(make_car):
+    """Create a sample car."""
+    return make_car()
+
+
+@pytest.fixture
+def honda_car(make_car):
+    """Create a second available car."""
+    return make_car(
+        brand="Honda",
+        model="Accord",
+        year=2024,
+        color="Red",
+        daily_price=32000.0,
+        vin="2HGBH41JXMN109187"
+    )
+
+
+@pytest.fixture
+def maintenance_car(make_car):
+    """Create a car in maintenance."""
+    return make_car(
+        brand="Ford",
+        model="Focus",
+        year=2022,
+        color="Black",
+        daily_price=25000.0,
+        vin="3HGBH41JXMN109188",
+        status=CarStatus.MAINTENANCE
+    )
+
+
+@pytest.fixture
+def seed_bookings(booking_repo):
+    """Get a helper that stores several bookings in a single batch."""
+    def _seed(*bookings):
+        return booking_repo.create_many(bookings)
+    return _seed
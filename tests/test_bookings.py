@@ -1,60 +1,47 @@
+import asyncio
+import orjson
 import pytest
-from datetime import date, datetime, timedelta
-from fastapi.testclient import TestClient
-from app.main import app, car_repo, booking_repo, dealer_repo
-from app.domain.models import Car, Booking, CarStatus, Dealer
-
-
-@pytest.fixture(autouse=True)
-def clear_database():
-    """Clear databases before each test."""
-    car_repo.db.clear()
-    booking_repo.db.clear()
-    dealer_repo.db.clear()
-    # Ensure initial dealer exists for tests
-    if not dealer_repo.get_all():
-        initial_dealer = Dealer(name="Oscar Mobility Main", location="New York, NY")
-        dealer_repo.create(initial_dealer)
-    yield
-    car_repo.db.clear()
-    booking_repo.db.clear()
-    dealer_repo.db.clear()
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def sample_car():
-    """Create a sample car."""
-    car = Car(
-        brand="Toyota",
-        model="Camry",
-        year=2023,
-        color="Blue",
-        daily_price=35000.0,
-        vin="1HGBH41JXMN109186",
-        status=CarStatus.AVAILABLE,
-        dealer_id=1
-    )
-    return car_repo.create(car)
+from datetime import datetime
+from app.domain.models import Booking, CarStatus
+
+BOOKINGS_URL = "/api/v1/bookings"
+AVAILABLE_CARS_URL = f"{BOOKINGS_URL}/available-cars"
+CARS_URL = "/api/v1/cars"
+
+# Car status values as they appear in JSON
+AVAILABLE = CarStatus.AVAILABLE.value
+MAINTENANCE = CarStatus.MAINTENANCE.value
+
+# Shared test data, built once at import
+DT_JAN15 = datetime(2024, 1, 15, 10, 0)
+DT_JAN20 = datetime(2024, 1, 20, 14, 0)
+DT_FEB01 = datetime(2024, 2, 1, 10, 0)
+DT_FEB05 = datetime(2024, 2, 5, 14, 0)
+
+JOHN_DOE = {"customer_name": "John Doe", "customer_email": "john.doe@example.com"}
+JANE_SMITH = {"customer_name": "Jane Smith", "customer_email": "jane.smith@example.com"}
+
+BOOKING_JOHN = {**JOHN_DOE, "start_datetime": DT_JAN15, "end_datetime": DT_JAN20}
+BOOKING_JANE = {**JANE_SMITH, "start_datetime": DT_FEB01, "end_datetime": DT_FEB05}
+BOOKING_JOHN_TEMPLATE = {
+    **JOHN_DOE,
+    "start_datetime": DT_JAN15.isoformat(),
+    "end_datetime": DT_JAN20.isoformat()
+}
+
+# Query for available cars from Jan 15 to Jan 20
+JAN15_TO_JAN20 = {
+    "start_datetime": "2024-01-15T00:00:00",
+    "end_datetime": "2024-01-20T00:00:00"
+}
 
 
 def test_create_booking(client, sample_car):
     """Test creating a new booking."""
-    booking_data = {
-        "car_id": sample_car.id,
-        "customer_name": "John Doe",
-        "customer_email": "john.doe@example.com",
-        "start_datetime": "2024-01-15T10:00:00",
-        "end_datetime": "2024-01-20T14:00:00"
-    }
-    response = client.post("/api/v1/bookings", json=booking_data)
+    booking_data = {**BOOKING_JOHN_TEMPLATE, "car_id": sample_car.id}
+    response = client.post(BOOKINGS_URL, json=booking_data)
     assert response.status_code == 201
-    data = response.json()
+    data = orjson.loads(response.content)
     assert data["car_id"] == sample_car.id
     assert data["customer_name"] == "John Doe"
     assert data["id"] is not None
@@ -62,46 +49,34 @@ def test_create_booking(client, sample_car):
 
 def test_create_booking_car_not_found(client):
     """Test creating a booking for non-existent car."""
-    booking_data = {
-        "car_id": 999,
-        "customer_name": "John Doe",
-        "customer_email": "john.doe@example.com",
-        "start_datetime": "2024-01-15T10:00:00",
-        "end_datetime": "2024-01-20T14:00:00"
-    }
-    response = client.post("/api/v1/bookings", json=booking_data)
+    booking_data = {**BOOKING_JOHN_TEMPLATE, "car_id": 999}
+    response = client.post(BOOKINGS_URL, json=booking_data)
     assert response.status_code == 404
 
 
-def test_create_booking_maintenance_car(client, sample_car):
+@pytest.mark.parametrize("method", ["get", "delete"])
+def test_booking_not_found(client, method):
+    """Test accessing a non-existent booking."""
+    response = client.request(method, f"{BOOKINGS_URL}/999")
+    assert response.status_code == 404
+
+
+def test_create_booking_maintenance_car(client, car_repo, sample_car):
     """Test creating a booking for car in maintenance."""
     # Mark car as in maintenance
-    from app.domain.models import CarStatus
     sample_car.status = CarStatus.MAINTENANCE
     car_repo.update(sample_car.id, sample_car)
     
-    booking_data = {
-        "car_id": sample_car.id,
-        "customer_name": "John Doe",
-        "customer_email": "john.doe@example.com",
-        "start_datetime": "2024-01-15T10:00:00",
-        "end_datetime": "2024-01-20T14:00:00"
-    }
-    response = client.post("/api/v1/bookings", json=booking_data)
+    booking_data = {**BOOKING_JOHN_TEMPLATE, "car_id": sample_car.id}
+    response = client.post(BOOKINGS_URL, json=booking_data)
     assert response.status_code == 400
-    assert "not available" in response.json()["detail"].lower()
+    assert b"is not available" in response.content
 
 
-def test_create_booking_conflicting_datetimes(client, sample_car):
+def test_create_booking_conflicting_datetimes(client, booking_repo, sample_car):
     """Test creating a booking with conflicting datetimes."""
     # Create first booking
-    booking1 = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
+    booking1 = Booking(car_id=sample_car.id, **BOOKING_JOHN)
     booking_repo.create(booking1)
     
     # Try to create overlapping booking
@@ -112,386 +87,406 @@ def test_create_booking_conflicting_datetimes(client, sample_car):
         "start_datetime": "2024-01-18T10:00:00",
         "end_datetime": "2024-01-25T14:00:00"
     }
-    response = client.post("/api/v1/bookings", json=booking_data)
-    response.json()["detail"] == "Overlapping booking"
+    response = client.post(BOOKINGS_URL, json=booking_data)
     assert response.status_code == 400
+    assert b"already booked" in response.content
 
 
-def test_create_booking_invalid_datetimes(client, sample_car):
-    """Test creating a booking with end_datetime before start_datetime."""
+@pytest.mark.parametrize("start, end", [
+    ("2024-01-20T10:00:00", "2024-01-15T14:00:00"),
+    ("2024-01-20T10:00:00", "2024-01-20T10:00:00"),
+])
+def test_create_booking_invalid_datetimes(client, sample_car, start, end):
+    """Test creating a booking with end_datetime not after start_datetime."""
     booking_data = {
+        **BOOKING_JOHN_TEMPLATE,
         "car_id": sample_car.id,
-        "customer_name": "John Doe",
-        "customer_email": "john.doe@example.com",
-        "start_datetime": "2024-01-20T10:00:00",
-        "end_datetime": "2024-01-15T14:00:00"
+        "start_datetime": start,
+        "end_datetime": end
     }
-    response = client.post("/api/v1/bookings", json=booking_data)
+    response = client.post(BOOKINGS_URL, json=booking_data)
     assert response.status_code == 422  # Validation error
 
 
-def test_get_bookings(client, sample_car):
+def test_get_bookings(client, booking_repo, sample_car):
     """Test getting all bookings."""
-    booking = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
     booking_repo.create(booking)
     
-    response = client.get("/api/v1/bookings")
+    response = client.get(BOOKINGS_URL)
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert len(data) == 1
 
 
-def test_get_bookings_by_car_id(client, sample_car):
+def test_get_bookings_by_car_id(client, sample_car, honda_car, seed_bookings):
     """Test getting bookings filtered by car ID."""
-    booking = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
-    booking_repo.create(booking)
-    
-    # Create another car and booking
-    car2 = Car(
-        brand="Honda",
-        model="Accord",
-        year=2024,
-        color="Red",
-        daily_price=32000.0,
-        vin="2HGBH41JXMN109187",
-        status=CarStatus.AVAILABLE,
-        dealer_id=1
+    seed_bookings(
+        Booking(car_id=sample_car.id, **BOOKING_JOHN),
+        Booking(car_id=honda_car.id, **BOOKING_JANE)
     )
-    car2 = car_repo.create(car2)
-    booking2 = Booking(
-        car_id=car2.id,
-        customer_name="Jane Smith",
-        customer_email="jane.smith@example.com",
-        start_datetime=datetime(2024, 2, 1, 10, 0),
-        end_datetime=datetime(2024, 2, 5, 14, 0)
-    )
-    booking_repo.create(booking2)
     
-    response = client.get(f"/api/v1/bookings?car_id={sample_car.id}")
+    response = client.get(BOOKINGS_URL, params={"car_id": sample_car.id})
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert len(data) == 1
     assert data[0]["car_id"] == sample_car.id
 
 
-def test_get_bookings_by_start_datetime(client, sample_car):
-    """Test getting bookings filtered by start_datetime."""
-    # Create bookings at different times
-    booking1 = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
-    booking_repo.create(booking1)
-    
-    booking2 = Booking(
-        car_id=sample_car.id,
-        customer_name="Jane Smith",
-        customer_email="jane.smith@example.com",
-        start_datetime=datetime(2024, 2, 1, 10, 0),
-        end_datetime=datetime(2024, 2, 5, 14, 0)
+def test_filter_bookings_by_start_datetime(booking_repo, sample_car, seed_bookings):
+    """Test filtering bookings by start_datetime."""
+    john, jane = seed_bookings(
+        Booking(car_id=sample_car.id, **BOOKING_JOHN),
+        Booking(car_id=sample_car.id, **BOOKING_JANE)
     )
-    booking_repo.create(booking2)
     
-    # Filter by start_datetime (should return bookings starting on or after this date)
-    response = client.get("/api/v1/bookings?start_datetime=2024-02-01T00:00:00")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 1
-    assert data[0]["customer_name"] == "Jane Smith"
+    # Bookings starting on or after this date
+    assert booking_repo.filter(start_datetime=datetime(2024, 2, 1)) == [jane]
 
 
-def test_get_bookings_by_end_datetime(client, sample_car):
-    """Test getting bookings filtered by end_datetime."""
-    # Create bookings at different times
-    booking1 = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
+def test_filter_bookings_by_end_datetime(booking_repo, sample_car, seed_bookings):
+    """Test filtering bookings by end_datetime."""
+    john, jane = seed_bookings(
+        Booking(car_id=sample_car.id, **BOOKING_JOHN),
+        Booking(car_id=sample_car.id, **BOOKING_JANE)
     )
-    booking_repo.create(booking1)
     
-    booking2 = Booking(
-        car_id=sample_car.id,
-        customer_name="Jane Smith",
-        customer_email="jane.smith@example.com",
-        start_datetime=datetime(2024, 2, 1, 10, 0),
-        end_datetime=datetime(2024, 2, 5, 14, 0)
+    # Bookings ending on or before this date
+    assert booking_repo.filter(end_datetime=datetime(2024, 1, 25)) == [john]
+
+
+def test_filter_bookings_by_datetime_range(booking_repo, sample_car, seed_bookings):
+    """Test filtering bookings by datetime range (overlap)."""
+    john, jane, bob = seed_bookings(
+        Booking(car_id=sample_car.id, **BOOKING_JOHN),
+        Booking(car_id=sample_car.id, **BOOKING_JANE),
+        Booking(
+            car_id=sample_car.id,
+            customer_name="Bob Wilson",
+            customer_email="bob.wilson@example.com",
+            start_datetime=datetime(2024, 1, 18, 10, 0),
+            end_datetime=datetime(2024, 1, 22, 14, 0)
+        )
     )
-    booking_repo.create(booking2)
     
-    # Filter by end_datetime (should return bookings ending on or before this date)
-    response = client.get("/api/v1/bookings?end_datetime=2024-01-25T00:00:00")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 1
-    assert data[0]["customer_name"] == "John Doe"
+    bookings = booking_repo.filter(
+        start_datetime=datetime(2024, 1, 16),
+        end_datetime=datetime(2024, 1, 21)
+    )
+    assert bookings == [john, bob]
 
 
-def test_get_bookings_by_datetime_range(client, sample_car):
-    """Test getting bookings filtered by datetime range (overlap)."""
-    # Create bookings at different times
-    booking1 = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
-    booking_repo.create(booking1)
-    
-    booking2 = Booking(
-        car_id=sample_car.id,
-        customer_name="Jane Smith",
-        customer_email="jane.smith@example.com",
-        start_datetime=datetime(2024, 2, 1, 10, 0),
-        end_datetime=datetime(2024, 2, 5, 14, 0)
-    )
-    booking_repo.create(booking2)
-    
-    booking3 = Booking(
-        car_id=sample_car.id,
-        customer_name="Bob Wilson",
-        customer_email="bob.wilson@example.com",
-        start_datetime=datetime(2024, 1, 18, 10, 0),
-        end_datetime=datetime(2024, 1, 22, 14, 0)
-    )
-    booking_repo.create(booking3)
-    
-    # Filter by datetime range (should return bookings that overlap)
-    # Range: 2024-01-16 to 2024-01-21 should match booking1 and booking3
-    response = client.get("/api/v1/bookings?start_datetime=2024-01-16T00:00:00&end_datetime=2024-01-21T00:00:00")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 2
-    customer_names = {b["customer_name"] for b in data}
-    assert "John Doe" in customer_names
-    assert "Bob Wilson" in customer_names
-    assert "Jane Smith" not in customer_names
-
-
-def test_get_bookings_by_car_id_and_datetime(client, sample_car):
-    """Test getting bookings filtered by both car_id and datetime range."""
-    # Create another car
-    car2 = Car(
-        brand="Honda",
-        model="Accord",
-        year=2024,
-        color="Red",
-        daily_price=32000.0,
-        vin="2HGBH41JXMN109187",
-        status=CarStatus.AVAILABLE,
-        dealer_id=1
-    )
-    car2 = car_repo.create(car2)
-    
+def test_filter_bookings_by_car_id_and_datetime(booking_repo, sample_car, honda_car, seed_bookings):
+    """Test filtering bookings by both car_id and datetime range."""
     # Create bookings for both cars
-    booking1 = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
+    john, jane = seed_bookings(
+        Booking(car_id=sample_car.id, **BOOKING_JOHN),
+        Booking(
+            car_id=honda_car.id,
+            **JANE_SMITH,
+            start_datetime=datetime(2024, 1, 16, 10, 0),
+            end_datetime=datetime(2024, 1, 18, 14, 0)
+        )
     )
-    booking_repo.create(booking1)
     
-    booking2 = Booking(
-        car_id=car2.id,
-        customer_name="Jane Smith",
-        customer_email="jane.smith@example.com",
-        start_datetime=datetime(2024, 1, 16, 10, 0),
-        end_datetime=datetime(2024, 1, 18, 14, 0)
+    bookings = booking_repo.filter(
+        car_id=sample_car.id,
+        start_datetime=datetime(2024, 1, 14),
+        end_datetime=datetime(2024, 1, 21)
     )
-    booking_repo.create(booking2)
-    
-    # Filter by car_id and datetime range
-    response = client.get(f"/api/v1/bookings?car_id={sample_car.id}&start_datetime=2024-01-14T00:00:00&end_datetime=2024-01-21T00:00:00")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 1
-    assert data[0]["car_id"] == sample_car.id
-    assert data[0]["customer_name"] == "John Doe"
+    assert bookings == [john]
 
 
-def test_get_booking_by_id(client, sample_car):
+def test_get_booking_by_id(client, booking_repo, sample_car):
     """Test getting a specific booking."""
-    booking = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
     created_booking = booking_repo.create(booking)
     
-    response = client.get(f"/api/v1/bookings/{created_booking.id}")
+    response = client.get(f"{BOOKINGS_URL}/{created_booking.id}")
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert data["customer_name"] == "John Doe"
     assert data["id"] == created_booking.id
 
 
-def test_delete_booking(client, sample_car):
+def test_delete_booking(client, booking_repo, sample_car):
     """Test deleting a booking."""
-    booking = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
     created_booking = booking_repo.create(booking)
     
-    response = client.delete(f"/api/v1/bookings/{created_booking.id}")
+    response = client.delete(f"{BOOKINGS_URL}/{created_booking.id}")
     assert response.status_code == 204
     
     # Verify booking is deleted
-    response = client.get(f"/api/v1/bookings/{created_booking.id}")
+    response = client.get(f"{BOOKINGS_URL}/{created_booking.id}")
     assert response.status_code == 404
 
 
-def test_get_available_cars_for_date_range(client, sample_car):
+def test_get_available_cars_for_date_range(client, booking_repo, sample_car, honda_car):
     """Test getting cars available for a specific date range."""
-    # Create another available car
-    car2 = Car(
-        brand="Honda",
-        model="Accord",
-        year=2024,
-        color="Red",
-        daily_price=32000.0,
-        vin="2HGBH41JXMN109187",
-        status=CarStatus.AVAILABLE,
-        dealer_id=1
-    )
-    car2 = car_repo.create(car2)
-    
     # Create a booking for sample_car that conflicts with the requested range
-    booking = Booking(
-        car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 1, 15, 10, 0),
-        end_datetime=datetime(2024, 1, 20, 14, 0)
-    )
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
     booking_repo.create(booking)
     
     # Request cars available for a date range that conflicts with sample_car's booking
-    response = client.get("/api/v1/bookings/available-cars", params={
+    response = client.get(AVAILABLE_CARS_URL, params={
         "start_datetime": "2024-01-16T00:00:00",
         "end_datetime": "2024-01-18T00:00:00"
     })
     assert response.status_code == 200
-    data = response.json()
-    # Should only return car2 (sample_car has a conflicting booking)
+    data = orjson.loads(response.content)
+    # Should only return honda_car (sample_car has a conflicting booking)
     assert len(data) == 1
-    assert data[0]["id"] == car2.id
+    assert data[0]["id"] == honda_car.id
     assert data[0]["brand"] == "Honda"
 
 
-def test_get_available_cars_excludes_maintenance(client, sample_car):
+def test_get_available_cars_excludes_maintenance(client, sample_car, maintenance_car):
     """Test that cars in maintenance are excluded from availability filtering."""
-    # Create a car in maintenance
-    maintenance_car = Car(
-        brand="Ford",
-        model="Focus",
-        year=2022,
-        color="Black",
-        daily_price=25000.0,
-        vin="3HGBH41JXMN109188",
-        status=CarStatus.MAINTENANCE,
-        dealer_id=1
-    )
-    maintenance_car = car_repo.create(maintenance_car)
-    
     # Request available cars for a date range
-    response = client.get("/api/v1/bookings/available-cars", params={
-        "start_datetime": "2024-01-15T00:00:00",
-        "end_datetime": "2024-01-20T00:00:00"
-    })
+    response = client.get(AVAILABLE_CARS_URL, params=JAN15_TO_JAN20)
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     # Should only return sample_car (maintenance_car is excluded)
     assert len(data) == 1
     assert data[0]["id"] == sample_car.id
-    assert data[0]["status"] == "available"
-
-
-def test_get_available_cars_invalid_date_range(client, sample_car):
-    """Test that invalid date ranges (end before start) return an error."""
-    response = client.get("/api/v1/bookings/available-cars", params={
-        "start_datetime": "2024-01-20T00:00:00",
-        "end_datetime": "2024-01-15T00:00:00"
+    assert data[0]["status"] == AVAILABLE
+
+
+@pytest.mark.parametrize("start, end", [
+    ("2024-01-20T00:00:00", "2024-01-15T00:00:00"),
+    ("2024-01-20T00:00:00", "2024-01-20T00:00:00"),
+])
+def test_get_available_cars_invalid_date_range(client, start, end):
+    """Test that invalid date ranges (end not after start) return an error."""
+    response = client.get(AVAILABLE_CARS_URL, params={
+        "start_datetime": start,
+        "end_datetime": end
     })
     assert response.status_code == 400
-    assert "end_datetime must be after start_datetime" in response.json()["detail"]
+    assert b"end_datetime must be after start_datetime" in response.content
 
 
-def test_get_available_cars_no_conflicts(client, sample_car):
+def test_get_available_cars_no_conflicts(client, booking_repo, sample_car, honda_car):
     """Test getting available cars when there are no booking conflicts."""
-    # Create another available car
-    car2 = Car(
-        brand="Honda",
-        model="Accord",
-        year=2024,
-        color="Red",
-        daily_price=32000.0,
-        vin="2HGBH41JXMN109187",
-        status=CarStatus.AVAILABLE,
-        dealer_id=1
-    )
-    car2 = car_repo.create(car2)
-    
     # Create a booking for sample_car, but for a different date range
     booking = Booking(
         car_id=sample_car.id,
-        customer_name="John Doe",
-        customer_email="john.doe@example.com",
-        start_datetime=datetime(2024, 2, 1, 10, 0),
-        end_datetime=datetime(2024, 2, 5, 14, 0)
+        **JOHN_DOE,
+        start_datetime=DT_FEB01,
+        end_datetime=DT_FEB05
     )
     booking_repo.create(booking)
     
     # Request cars available for a date range that doesn't conflict
-    response = client.get("/api/v1/bookings/available-cars", params={
-        "start_datetime": "2024-01-15T00:00:00",
-        "end_datetime": "2024-01-20T00:00:00"
-    })
+    response = client.get(AVAILABLE_CARS_URL, params=JAN15_TO_JAN20)
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     # Should return both cars (no conflicts for the requested range)
     assert len(data) == 2
     car_ids = {car["id"] for car in data}
     assert sample_car.id in car_ids
-    assert car2.id in car_ids
+    assert honda_car.id in car_ids
 
 
-def test_get_available_cars_missing_parameters(client, sample_car):
+@pytest.mark.parametrize("params", [
+    {"start_datetime": "2024-01-15T00:00:00"},
+    {"end_datetime": "2024-01-20T00:00:00"},
+])
+def test_get_available_cars_missing_parameters(client, params):
     """Test that missing required parameters return an error."""
-    # Missing end_datetime
-    response = client.get("/api/v1/bookings/available-cars", params={
-        "start_datetime": "2024-01-15T00:00:00"
-    })
+    response = client.get(AVAILABLE_CARS_URL, params=params)
     assert response.status_code == 422  # Validation error
+
+
+def test_delete_booking_updates_car_bookings(client, booking_repo, sample_car):
+    """Test that a cancelled booking no longer counts against its car."""
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
+    created_booking = booking_repo.create(booking)
+    assert booking_repo.get_by_car_id(sample_car.id) == [created_booking]
+    
+    response = client.delete(f"{BOOKINGS_URL}/{created_booking.id}")
+    assert response.status_code == 204
+    assert booking_repo.get_by_car_id(sample_car.id) == []
+    assert not booking_repo.has_conflicting_booking(
+        sample_car.id,
+        datetime(2024, 1, 16, 10, 0),
+        datetime(2024, 1, 18, 10, 0)
+    )
+
+
+def test_has_conflicting_booking_boundaries(booking_repo, sample_car):
+    """Test conflict detection for short and long ranges around a multi-day booking."""
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
+    created_booking = booking_repo.create(booking)
+    
+    # Short range inside the booking
+    assert booking_repo.has_conflicting_booking(
+        sample_car.id, datetime(2024, 1, 17, 8, 0), datetime(2024, 1, 17, 9, 0)
+    )
+    # Range touching the booking's end is not a conflict
+    assert not booking_repo.has_conflicting_booking(
+        sample_car.id, DT_JAN20, datetime(2024, 1, 20, 18, 0)
+    )
+    # Long range enclosing the booking
+    assert booking_repo.has_conflicting_booking(
+        sample_car.id, datetime(2023, 1, 1), datetime(2025, 1, 1)
+    )
+    # The booking itself can be excluded
+    assert not booking_repo.has_conflicting_booking(
+        sample_car.id,
+        datetime(2024, 1, 17, 8, 0),
+        datetime(2024, 1, 17, 9, 0),
+        exclude_booking_id=created_booking.id
+    )
+
+
+def test_get_bookings_reflects_cancellations(client, booking_repo, sample_car):
+    """Test that the cached booking list is refreshed after a cancellation."""
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
+    created_booking = booking_repo.create(booking)
+    
+    response = client.get(BOOKINGS_URL, params={"car_id": sample_car.id})
+    assert len(orjson.loads(response.content)) == 1
+    
+    client.delete(f"{BOOKINGS_URL}/{created_booking.id}")
+    response = client.get(BOOKINGS_URL, params={"car_id": sample_car.id})
+    assert response.status_code == 200
+    assert orjson.loads(response.content) == []
+
+
+def test_has_conflicting_booking_with_earlier_long_booking(booking_repo, sample_car, seed_bookings):
+    """Test that a long booking is found behind later, shorter ones."""
+    seed_bookings(*(
+        Booking(car_id=sample_car.id, **JOHN_DOE, start_datetime=start, end_datetime=end)
+        for start, end in [
+            (datetime(2024, 1, 1), datetime(2024, 3, 1)),
+            (datetime(2024, 1, 10), datetime(2024, 1, 11)),
+            (datetime(2024, 2, 1), datetime(2024, 2, 2)),
+        ]
+    ))
+    
+    assert booking_repo.has_conflicting_booking(
+        sample_car.id, datetime(2024, 2, 20), datetime(2024, 2, 21)
+    )
+    assert not booking_repo.has_conflicting_booking(
+        sample_car.id, datetime(2024, 3, 1), datetime(2024, 3, 5)
+    )
+    assert not booking_repo.has_conflicting_booking(
+        sample_car.id, datetime(2023, 12, 1), datetime(2024, 1, 1)
+    )
+
+
+def test_busy_cars_in_range(booking_repo, sample_car):
+    """Test collecting the cars booked during a datetime range."""
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
+    booking_repo.create(booking)
+    
+    assert booking_repo.busy_cars_in_range(
+        datetime(2024, 1, 18), datetime(2024, 1, 25)
+    ) == {sample_car.id}
+    assert booking_repo.busy_cars_in_range(
+        DT_JAN20, datetime(2024, 1, 25)
+    ) == set()
+
+
+@pytest.mark.asyncio
+async def test_get_available_cars_mixed_timezones(async_client, sample_car):
+    """Test that naive query datetimes are compared as UTC against aware bookings."""
+    booking_data = {
+        "car_id": sample_car.id,
+        "customer_name": "John Doe",
+        "customer_email": "john.doe@example.com",
+        "start_datetime": "2024-01-15T10:00:00Z",
+        "end_datetime": "2024-01-20T14:00:00+02:00"
+    }
+    response = await async_client.post(BOOKINGS_URL, json=booking_data)
+    assert response.status_code == 201
+    
+    # The booking ends at 12:00 UTC
+    overlapping, adjacent = await asyncio.gather(
+        async_client.get(AVAILABLE_CARS_URL, params={
+            "start_datetime": "2024-01-20T11:00:00",
+            "end_datetime": "2024-01-21T00:00:00"
+        }),
+        async_client.get(AVAILABLE_CARS_URL, params={
+            "start_datetime": "2024-01-20T12:00:00",
+            "end_datetime": "2024-01-21T00:00:00"
+        })
+    )
+    assert overlapping.status_code == 200
+    assert orjson.loads(overlapping.content) == []
+    assert adjacent.status_code == 200
+    assert len(orjson.loads(adjacent.content)) == 1
     
-    # Missing start_datetime
-    response = client.get("/api/v1/bookings/available-cars", params={
-        "end_datetime": "2024-01-20T00:00:00"
+    # A naive start with an aware end is a valid range, not a comparison error
+    response = await async_client.get(AVAILABLE_CARS_URL, params={
+        "start_datetime": "2024-01-01T00:00:00",
+        "end_datetime": "2024-01-02T00:00:00Z"
     })
-    assert response.status_code == 422  # Validation error
+    assert response.status_code == 200
+    assert len(orjson.loads(response.content)) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_booking_mixed_timezones(async_client, sample_car):
+    """Test that a booking may mix a naive start with an aware end."""
+    booking_data = {
+        **BOOKING_JOHN_TEMPLATE,
+        "car_id": sample_car.id,
+        "start_datetime": "2024-02-01T00:00:00",
+        "end_datetime": "2024-02-02T00:00:00Z"
+    }
+    response = await async_client.post(BOOKINGS_URL, json=booking_data)
+    assert response.status_code == 201
+    
+    # The reversed range is rejected as invalid rather than failing to compare
+    booking_data["start_datetime"] = "2024-02-03T00:00:00"
+    response = await async_client.post(BOOKINGS_URL, json=booking_data)
+    assert response.status_code == 422
 
+
+def test_get_available_cars_follows_status_updates(client, sample_car):
+    """Test that status changes are reflected in available cars."""
+    client.put(f"{CARS_URL}/{sample_car.id}", json={"status": MAINTENANCE})
+    response = client.get(AVAILABLE_CARS_URL, params=JAN15_TO_JAN20)
+    assert orjson.loads(response.content) == []
+    
+    client.put(f"{CARS_URL}/{sample_car.id}", json={"status": AVAILABLE})
+    response = client.get(AVAILABLE_CARS_URL, params=JAN15_TO_JAN20)
+    assert [car["id"] for car in orjson.loads(response.content)] == [sample_car.id]
+
+
+def test_get_bookings_unknown_car_with_datetime_filter(client, booking_repo, sample_car):
+    """Test that filtering by a car without bookings returns an empty list."""
+    booking = Booking(car_id=sample_car.id, **BOOKING_JOHN)
+    booking_repo.create(booking)
+    
+    response = client.get(BOOKINGS_URL, params={
+        "car_id": 999,
+        "start_datetime": "2024-01-14T00:00:00"
+    })
+    assert response.status_code == 200
+    assert orjson.loads(response.content) == []
+
+
+def test_seed_bookings_is_all_or_nothing(booking_repo, sample_car, seed_bookings):
+    """Test that a failing batch leaves no bookings behind."""
+    with pytest.raises(ValueError):
+        seed_bookings(
+            Booking(id=1, car_id=sample_car.id, **BOOKING_JOHN),
+            Booking(id=1, car_id=sample_car.id, **BOOKING_JANE)
+        )
+    assert booking_repo.get_all() == []
+    assert booking_repo.get_by_car_id(sample_car.id) == []
+
+
+def test_get_bookings_cache_is_bounded(client, sample_car):
+    """Test that distinct filter queries cannot grow the response cache without limit."""
+    from app.api.bookings import bookings_cache
+    for microsecond in range(bookings_cache._maxsize + 10):
+        response = client.get(BOOKINGS_URL, params={
+            "start_datetime": f"2024-01-14T00:00:00.{microsecond:06d}"
+        })
+        assert response.status_code == 200
+    assert len(bookings_cache._bodies) == bookings_cache._maxsize
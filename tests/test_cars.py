@@ -1,127 +1,86 @@
+import orjson
 import pytest
-from datetime import date, datetime
-from fastapi.testclient import TestClient
-from app.main import app, car_repo, booking_repo, dealer_repo
-from app.domain.models import Car, Booking, CarStatus, Dealer
-
-
-@pytest.fixture(autouse=True)
-def clear_database():
-    """Clear databases before each test."""
-    car_repo.db.clear()
-    booking_repo.db.clear()
-    dealer_repo.db.clear()
-    # Ensure initial dealer exists for tests
-    if not dealer_repo.get_all():
-        initial_dealer = Dealer(name="Oscar Mobility Main", location="New York, NY")
-        dealer_repo.create(initial_dealer)
-    yield
-    car_repo.db.clear()
-    booking_repo.db.clear()
-    dealer_repo.db.clear()
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def sample_car():
-    """Create a sample car."""
-    car = Car(
-        brand="Toyota",
-        model="Camry",
-        year=2023,
-        color="Blue",
-        daily_price=35000.0,
-        vin="1HGBH41JXMN109186", 
-        status=CarStatus.AVAILABLE,
-        dealer_id=1
-    )
-    return car_repo.create(car)
+from app.domain.models import CarStatus
+
+CARS_URL = "/api/v1/cars"
+
+# Car status values as they appear in JSON
+AVAILABLE = CarStatus.AVAILABLE.value
+MAINTENANCE = CarStatus.MAINTENANCE.value
+
+# Shared test data, built once at import
+HONDA_ACCORD = {
+    "brand": "Honda",
+    "model": "Accord",
+    "year": 2024,
+    "color": "Red",
+    "daily_price": 32000.0,
+    "vin": "2HGBH41JXMN109187",
+    "status": AVAILABLE,
+    "dealer_id": 1
+}
 
 
 def test_create_car(client):
     """Test creating a new car."""
-    car_data = {
-        "brand": "Honda",
-        "model": "Accord",
-        "year": 2024,
-        "color": "Red",
-        "daily_price": 32000.0,
-        "vin": "2HGBH41JXMN109187",
-        "status": "available",
-        "dealer_id": 1
-    }
-    response = client.post("/api/v1/cars", json=car_data)
+    response = client.post(CARS_URL, json=HONDA_ACCORD)
     assert response.status_code == 201
-    data = response.json()
+    data = orjson.loads(response.content)
     assert data["brand"] == "Honda"
     assert data["model"] == "Accord"
     assert data["year"] == 2024
     assert data["id"] is not None
 
 
-def test_create_car_duplicate_vin(client):
-    """Test creating a car with duplicate VIN."""
-    car_data = {
-        "brand": "Toyota",
-        "model": "Camry",
-        "year": 2023,
-        "color": "Blue",
-        "daily_price": 35000.0,
-        "vin": "1HGBH41JXMN109186", 
-        "status": "available",
-        "dealer_id": 1
-    }
-    client.post("/api/v1/cars", json=car_data)
-    
-    # Try to create another car with same VIN
-    response = client.post("/api/v1/cars", json=car_data)
-    response.json()["detail"] == "Car with this VIN already exists"
+@pytest.mark.parametrize("method, path, payload", [
+    ("post", CARS_URL, {**HONDA_ACCORD, "vin": "1HGBH41JXMN109186"}),
+    ("put", CARS_URL + "/{car_id}", {"vin": "1HGBH41JXMN109186"}),
+])
+def test_car_duplicate_vin(client, sample_car, honda_car, method, path, payload):
+    """Test creating or updating a car with a VIN that is already taken."""
+    response = client.request(method, path.format(car_id=honda_car.id), json=payload)
     assert response.status_code == 400
+    assert b"already exists" in response.content
 
 
 def test_get_cars(client, sample_car):
     """Test getting all cars."""
-    response = client.get("/api/v1/cars")
+    response = client.get(CARS_URL)
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert len(data) == 1
     assert data[0]["brand"] == "Toyota"
 
 
 def test_get_car_by_id(client, sample_car):
     """Test getting a specific car."""
-    response = client.get(f"/api/v1/cars/{sample_car.id}")
+    response = client.get(f"{CARS_URL}/{sample_car.id}")
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert data["brand"] == "Toyota"
     assert data["id"] == sample_car.id
 
 
-def test_get_car_not_found(client):
-    """Test getting a non-existent car."""
-    response = client.get("/api/v1/cars/999")
+@pytest.mark.parametrize("method, payload", [
+    ("get", None),
+    ("put", {"color": "Red"}),
+    ("delete", None),
+])
+def test_car_not_found(client, method, payload):
+    """Test accessing a non-existent car."""
+    response = client.request(method, f"{CARS_URL}/999", json=payload)
     assert response.status_code == 404
 
 
-def test_create_car_invalid_dealer_id(client):
-    """Test creating a car with non-existent dealer_id."""
-    car_data = {
-        "brand": "Toyota",
-        "model": "Camry",
-        "year": 2023,
-        "color": "Blue",
-        "daily_price": 35000.0,
-        "vin": "1HGBH41JXMN109186",
-        "dealer_id": 999
-    }
-    response = client.post("/api/v1/cars", json=car_data)
+@pytest.mark.parametrize("method, path, payload", [
+    ("post", CARS_URL, {**HONDA_ACCORD, "dealer_id": 999}),
+    ("put", CARS_URL + "/{car_id}", {"dealer_id": 999}),
+])
+def test_car_invalid_dealer_id(client, sample_car, method, path, payload):
+    """Test creating or updating a car with non-existent dealer_id."""
+    response = client.request(method, path.format(car_id=sample_car.id), json=payload)
     assert response.status_code == 404
-    assert "Dealer with id 999 not found" in response.json()["detail"]
+    assert b"Dealer with id 999 not found" in response.content
 
 
 def test_update_car(client, sample_car):
@@ -130,9 +89,9 @@ def test_update_car(client, sample_car):
         "color": "Red",
         "daily_price": 36000.0
     }
-    response = client.put(f"/api/v1/cars/{sample_car.id}", json=update_data)
+    response = client.put(f"{CARS_URL}/{sample_car.id}", json=update_data)
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     assert data["color"] == "Red"
     assert data["daily_price"] == 36000.0
     assert data["brand"] == "Toyota"  # Unchanged field
@@ -141,25 +100,15 @@ def test_update_car(client, sample_car):
 def test_update_car_status(client, sample_car):
     """Test updating car status."""
     update_data = {
-        "status": "maintenance"
+        "status": MAINTENANCE
     }
-    response = client.put(f"/api/v1/cars/{sample_car.id}", json=update_data)
+    response = client.put(f"{CARS_URL}/{sample_car.id}", json=update_data)
     assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "maintenance"
+    data = orjson.loads(response.content)
+    assert data["status"] == MAINTENANCE
     assert data["brand"] == "Toyota"  # Unchanged field
 
 
-def test_update_car_invalid_dealer_id(client, sample_car):
-    """Test updating a car with non-existent dealer_id."""
-    update_data = {
-        "dealer_id": 999
-    }
-    response = client.put(f"/api/v1/cars/{sample_car.id}", json=update_data)
-    assert response.status_code == 404
-    assert "Dealer with id 999 not found" in response.json()["detail"]
-
-
 def test_create_car_with_status(client):
     """Test creating a car with specific status."""
     car_data = {
@@ -169,44 +118,73 @@ def test_create_car_with_status(client):
         "color": "Black",
         "daily_price": 25000.0,
         "vin": "3HGBH41JXMN109188",
-        "status": "maintenance",
+        "status": MAINTENANCE,
         "dealer_id": 1
     }
-    response = client.post("/api/v1/cars", json=car_data)
+    response = client.post(CARS_URL, json=car_data)
     assert response.status_code == 201
-    data = response.json()
-    assert data["status"] == "maintenance"
+    data = orjson.loads(response.content)
+    assert data["status"] == MAINTENANCE
 
 
 def test_delete_car(client, sample_car):
     """Test deleting a car."""
-    response = client.delete(f"/api/v1/cars/{sample_car.id}")
+    response = client.delete(f"{CARS_URL}/{sample_car.id}")
     assert response.status_code == 204
     
     # Verify car is deleted
-    response = client.get(f"/api/v1/cars/{sample_car.id}")
+    response = client.get(f"{CARS_URL}/{sample_car.id}")
     assert response.status_code == 404
 
 
-def test_get_cars_without_date_range_returns_all(client, sample_car):
+def test_get_cars_without_date_range_returns_all(client, sample_car, maintenance_car):
     """Test that getting cars without date range parameters returns all cars."""
-    # Create a car in maintenance
-    maintenance_car = Car(
-        brand="Ford",
-        model="Focus",
-        year=2022,
-        color="Black",
-        daily_price=25000.0,
-        vin="3HGBH41JXMN109188",
-        status=CarStatus.MAINTENANCE,
-        dealer_id=1
-    )
-    maintenance_car = car_repo.create(maintenance_car)
-    
     # Get all cars without date range filter
-    response = client.get("/api/v1/cars")
+    response = client.get(CARS_URL)
     assert response.status_code == 200
-    data = response.json()
+    data = orjson.loads(response.content)
     # Should return all cars regardless of status
     assert len(data) == 2
 
+
+def test_update_car_vin_frees_previous_vin(client, car_repo, sample_car):
+    """Test that changing a car's VIN allows the previous VIN to be reused."""
+    old_vin = sample_car.vin
+    response = client.put(f"{CARS_URL}/{sample_car.id}", json={"vin": "4HGBH41JXMN109189"})
+    assert response.status_code == 200
+    assert car_repo.get_by_vin(old_vin) is None
+    assert car_repo.get_by_vin("4HGBH41JXMN109189").id == sample_car.id
+    
+    response = client.post(CARS_URL, json={**HONDA_ACCORD, "vin": old_vin})
+    assert response.status_code == 201
+    assert len(car_repo._vin_index) == len(car_repo.get_all())
+
+
+def test_delete_car_removes_vin_from_index(client, car_repo, sample_car):
+    """Test that deleting a car removes its VIN from the index."""
+    response = client.delete(f"{CARS_URL}/{sample_car.id}")
+    assert response.status_code == 204
+    assert car_repo.get_by_vin(sample_car.vin) is None
+    assert len(car_repo._vin_index) == len(car_repo.get_all())
+
+
+def test_get_cars_reflects_updates(client, sample_car):
+    """Test that the cached car list is refreshed after a change."""
+    response = client.get(CARS_URL)
+    assert orjson.loads(response.content)[0]["color"] == "Blue"
+    
+    client.put(f"{CARS_URL}/{sample_car.id}", json={"color": "Red"})
+    response = client.get(CARS_URL)
+    assert response.status_code == 200
+    assert orjson.loads(response.content)[0]["color"] == "Red"
+
+
+def test_restore_snapshot_rebuilds_indexes(car_repo, sample_car):
+    """Test that restoring a snapshot rolls back cars and their indexes."""
+    snapshot = car_repo.snapshot()
+    car_repo.delete(sample_car.id)
+    assert car_repo.get_by_vin(sample_car.vin) is None
+    
+    car_repo.restore(snapshot)
+    assert car_repo.get_by_vin(sample_car.vin) is sample_car
+    assert car_repo.get_available() == [sample_car]
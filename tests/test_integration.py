@@ -1,80 +1,38 @@
+import asyncio
+import orjson
 import pytest
 from datetime import datetime
-from fastapi.testclient import TestClient
-from app.main import app, car_repo, booking_repo, dealer_repo
-from app.domain.models import Car, Booking, CarStatus, Dealer
+from app.config import AppConfig
+from app.domain.models import Booking
 
+BOOKINGS_URL = "/api/v1/bookings"
+CARS_URL = "/api/v1/cars"
 
-@pytest.fixture(autouse=True)
-def clear_database():
-    """Clear databases before each test."""
-    car_repo.db.clear()
-    booking_repo.db.clear()
-    dealer_repo.db.clear()
-    # Ensure initial dealer exists for tests
-    if not dealer_repo.get_all():
-        initial_dealer = Dealer(name="Oscar Mobility Main", location="New York, NY")
-        dealer_repo.create(initial_dealer)
-    yield
-    car_repo.db.clear()
-    booking_repo.db.clear()
-    dealer_repo.db.clear()
 
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
-
-
-def test_car_deletion_with_bookings(client):
+def test_car_deletion_with_bookings(client, booking_repo, sample_car):
     """Test that a car with bookings cannot be deleted."""
-    # Create a car
-    car_data = {
-        "brand": "Toyota",
-        "model": "Camry",
-        "year": 2023,
-        "color": "Blue",
-        "daily_price": 35000.0,
-        "vin": "1HGBH41JXMN109186",
-        "dealer_id": 1
-    }
-    car_response = client.post("/api/v1/cars", json=car_data)
-    car_id = car_response.json()["id"]
-    
-    # Create a booking for the car
-    booking_data = {
-        "car_id": car_id,
-        "customer_name": "John D",
-        "customer_email": "john@example.com",
-        "start_datetime": "2024-01-15T10:00:00",
-        "end_datetime": "2024-01-20T14:00:00"
-    }
-    client.post("/api/v1/bookings", json=booking_data)
+    car_id = sample_car.id
+    booking_repo.create(Booking(
+        car_id=car_id,
+        customer_name="John D",
+        customer_email="john@example.com",
+        start_datetime=datetime(2024, 1, 15, 10, 0),
+        end_datetime=datetime(2024, 1, 20, 14, 0)
+    ))
     
     # Try to delete the car
-    response = client.delete(f"/api/v1/cars/{car_id}")
+    response = client.delete(f"{CARS_URL}/{car_id}")
     assert response.status_code == 400
     
     # Verify car still exists
-    response = client.get(f"/api/v1/cars/{car_id}")
+    response = client.get(f"{CARS_URL}/{car_id}")
     assert response.status_code == 200
 
 
-def test_booking_workflow(client):
+@pytest.mark.asyncio
+async def test_booking_workflow(async_client, honda_car):
     """Test complete booking workflow."""
-    # Create a car
-    car_data = {
-        "brand": "Honda",
-        "model": "Accord",
-        "year": 2024,
-        "color": "Red",
-        "daily_price": 32000.0,
-        "vin": "2HGBH41JXMN109187",
-        "dealer_id": 1
-    }
-    car_response = client.post("/api/v1/cars", json=car_data)
-    car_id = car_response.json()["id"]
+    car_id = honda_car.id
     
     # Create a booking
     booking_data = {
@@ -84,20 +42,21 @@ def test_booking_workflow(client):
         "start_datetime": "2024-03-01T10:00:00",
         "end_datetime": "2024-03-10T14:00:00"
     }
-    booking_response = client.post("/api/v1/bookings", json=booking_data)
+    booking_response = await async_client.post(BOOKINGS_URL, json=booking_data)
     assert booking_response.status_code == 201
-    booking_id = booking_response.json()["id"]
-    
-    # Verify booking exists
-    response = client.get(f"/api/v1/bookings/{booking_id}")
-    assert response.status_code == 200
+    booking_id = orjson.loads(booking_response.content)["id"]
     
-    # Get bookings for the car
-    response = client.get(f"/api/v1/bookings?car_id={car_id}")
-    assert response.status_code == 200
-    assert len(response.json()) == 1
+    # Verify booking exists and get bookings for the car
+    booking_response, car_bookings_response = await asyncio.gather(
+        async_client.get(f"{BOOKINGS_URL}/{booking_id}"),
+        async_client.get(BOOKINGS_URL, params={"car_id": car_id})
+    )
+    assert booking_response.status_code == 200
+    assert car_bookings_response.status_code == 200
+    assert len(orjson.loads(car_bookings_response.content)) == 1
     
-    # Try to create overlapping booking (should fail)
+    # Overlapping booking (should fail) and non-overlapping booking (should
+    # succeed); both only depend on the first booking, so order is irrelevant
     overlapping_booking = {
         "car_id": car_id,
         "customer_name": "Bob S",
@@ -105,10 +64,6 @@ def test_booking_workflow(client):
         "start_datetime": "2024-03-05T10:00:00",
         "end_datetime": "2024-03-15T14:00:00"
     }
-    response = client.post("/api/v1/bookings", json=overlapping_booking)
-    assert response.status_code == 400
-    
-    # Create non-overlapping booking (should succeed)
     non_overlapping_booking = {
         "car_id": car_id,
         "customer_name": "Charlie B",
@@ -116,19 +71,33 @@ def test_booking_workflow(client):
         "start_datetime": "2024-03-11T10:00:00",
         "end_datetime": "2024-03-15T14:00:00"
     }
-    response = client.post("/api/v1/bookings", json=non_overlapping_booking)
-    assert response.status_code == 201
+    overlapping_response, non_overlapping_response = await asyncio.gather(
+        async_client.post(BOOKINGS_URL, json=overlapping_booking),
+        async_client.post(BOOKINGS_URL, json=non_overlapping_booking)
+    )
+    assert overlapping_response.status_code == 400
+    assert non_overlapping_response.status_code == 201
     
     # Get all bookings for the car
-    response = client.get(f"/api/v1/bookings?car_id={car_id}")
+    response = await async_client.get(BOOKINGS_URL, params={"car_id": car_id})
     assert response.status_code == 200
-    assert len(response.json()) == 2
+    assert len(orjson.loads(response.content)) == 2
     
     # Cancel first booking
-    response = client.delete(f"/api/v1/bookings/{booking_id}")
+    response = await async_client.delete(f"{BOOKINGS_URL}/{booking_id}")
     assert response.status_code == 204
     
     # Verify booking is deleted
-    response = client.get(f"/api/v1/bookings/{booking_id}")
+    response = await async_client.get(f"{BOOKINGS_URL}/{booking_id}")
     assert response.status_code == 404
 
+
+def test_create_app_is_cached_per_config(app):
+    """Test that the application is built once per configuration."""
+    from app.main import create_app
+    assert create_app() is app
+    assert create_app(AppConfig()) is app
+    
+    docs_disabled = create_app(AppConfig(docs_url=None))
+    assert docs_disabled is not app
+    assert docs_disabled is create_app(AppConfig(docs_url=None))